@@ -29,11 +29,19 @@ echo 0 > /sys/kernel/debug/tracing/trace
 echo 1 > /sys/kernel/debug/tracing/events/f2fs/f2fs_gc_begin/enable
 echo 1 > /sys/kernel/debug/tracing/tracing_on
 
-# Reset Disk Stats for WAF calculation
-cat /sys/block/${DEV##*/}/stat > /tmp/stat_start.txt
-
-# CSV Header
-echo "Round,Disk_Percent,Time_Sec,Dirty_Segs,Free_Segs,GC_Events,Physical_MB" > "$RESULT_DIR/metrics.csv"
+# Start the metrics collector (f2fs status, GC trace events, disk stats, disk usage).
+# It samples in one process for the whole run instead of forking cp/grep/cat per round.
+# Plot with: python3 -m f2fs_analysis f2fs-metrics $RESULT_DIR/collector.csv
+REPO_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+PYTHONPATH="$REPO_DIR" python3 -m f2fs_analysis collect \
+    --device ${DEV##*/} --mount $MOUNT_POINT --output "$RESULT_DIR/collector.csv" &
+COLLECTOR_PID=$!
+# Background jobs start with SIGINT ignored, so stop it with SIGTERM, also on early exit
+trap 'kill -TERM $COLLECTOR_PID 2>/dev/null' EXIT
+
+# CSV Header (per-round timing; the metrics themselves are in collector.csv)
+# Start/End are epoch seconds, to join rounds against collector.csv timestamps
+echo "Round,Disk_Percent,Start_Epoch,End_Epoch,Time_Sec" > "$RESULT_DIR/rounds.csv"
 
 # --- 2. WORKLOAD DEFINITION (GENTLER VERSION) ---
 # 100MB Inserts + 1MB Updates (1000 random writes)
@@ -70,12 +78,11 @@ c.execute('COMMIT')
 ROW=0
 ROUND=1
 echo "Starting Experiment (Watchdog: ${TIMEOUT_SEC}s)..."
-echo "Results will be saved to: $RESULT_DIR/metrics.csv"
+echo "Results will be saved to: $RESULT_DIR/collector.csv and $RESULT_DIR/rounds.csv"
 
 while true; do
     # Check Disk Usage
-    USED_KB=$(df -k $MOUNT_POINT | tail -1 | awk '{print $3}')
-    TOTAL_KB=$(df -k $MOUNT_POINT | tail -1 | awk '{print $2}')
+    read TOTAL_KB USED_KB < <(df -k --output=size,used $MOUNT_POINT | tail -1)
     PCT=$((USED_KB * 100 / TOTAL_KB))
     
     # Stop workload at 95%
@@ -96,23 +103,13 @@ while true; do
     END_T=$(date +%s)
     DURATION=$((END_T - START_T))
 
-    # CAPTURE METRICS
-    cp /sys/kernel/debug/f2fs/status "$RESULT_DIR/status_$ROUND.txt"
-    DIRTY=$(grep -m 1 "Dirty" "$RESULT_DIR/status_$ROUND.txt" | awk -F: '{print $2}' | tr -d ' ,')
-    FREE=$(grep -m 1 "Free" "$RESULT_DIR/status_$ROUND.txt" | awk -F: '{print $2}' | tr -d ' ,')
-    GC_COUNT=$(grep -c "f2fs_gc_begin" /sys/kernel/debug/tracing/trace)
-    
-    NOW_STAT=$(cat /sys/block/${DEV##*/}/stat | awk '{print $7}')
-    START_STAT=$(awk '{print $7}' /tmp/stat_start.txt)
-    PHYSICAL_MB=$(( (NOW_STAT - START_STAT) * 512 / 1024 / 1024 ))
-
-    echo "$ROUND,$PCT,$DURATION,$DIRTY,$FREE,$GC_COUNT,$PHYSICAL_MB" >> "$RESULT_DIR/metrics.csv"
+    echo "$ROUND,$PCT,$START_T,$END_T,$DURATION" >> "$RESULT_DIR/rounds.csv"
     
     # CHECK FOR HANG/TIMEOUT
     if [ $EXIT_CODE -eq 124 ]; then
         echo "!!! CRITICAL: WORKLOAD TIMED OUT (GC WALL HIT) !!!"
         echo "The system took > $TIMEOUT_SEC seconds."
-        echo "Final,HANG,$DURATION,$DIRTY,$FREE,$GC_COUNT,$PHYSICAL_MB" >> "$RESULT_DIR/metrics.csv"
+        echo "Final,HANG,$START_T,$END_T,$DURATION" >> "$RESULT_DIR/rounds.csv"
         break
     fi
 
@@ -120,4 +117,8 @@ while true; do
     ROUND=$((ROUND + 1))
 done
 
+# Stop the collector; it flushes its last batch on SIGTERM
+kill -TERM $COLLECTOR_PID
+wait $COLLECTOR_PID
+
 echo "Experiment Complete."
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""
+Analysis tools for the F2FS / FEMU zombie-block experiments.
+
+Run ``python3 -m f2fs_analysis <subcommand> ...``; see ``f2fs_analysis.cli``.
+"""
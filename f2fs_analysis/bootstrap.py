@@ -0,0 +1,83 @@
+"""
+Vectorized bootstrap over repeated runs of one configuration.
+
+Every resample first picks runs with replacement and then redraws the
+segments / blocks inside each picked run. The second stage works on
+per-run counts (multinomial over histogram bins, binomial for a
+proportion), so the cost depends on the number of runs and bins and not on
+how many segments were traced. All resamples are drawn in one batched
+NumPy call.
+"""
+import numpy as np
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+def resample_runs(n_runs, n_resamples, rng):
+    """
+    Run indices of every resample, shape (n_resamples, n_runs).
+    """
+    return rng.integers(0, n_runs, size=(n_resamples, n_runs))
+
+
+def bootstrap_histograms(counts, n_resamples, rng):
+    """
+    Resampled histograms pooled over runs.
+
+    :param counts: Per-run bin counts, shape (n_runs, n_bins)
+    :return: Pooled bin counts of every resample, shape (n_resamples, n_bins)
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    counts = counts[counts.sum(axis=1) > 0]
+    if len(counts) == 0:
+        raise ValueError("no run has any counts to resample")
+
+    totals = counts.sum(axis=1)
+    probs = counts / totals[:, None]
+
+    picks = resample_runs(len(counts), n_resamples, rng)
+    drawn = rng.multinomial(totals[picks], probs[picks])
+    return drawn.sum(axis=1)
+
+
+def bootstrap_proportion(successes, totals, n_resamples, rng):
+    """
+    Resampled pooled proportion sum(successes) / sum(totals) over runs.
+
+    :return: Proportion of every resample, shape (n_resamples,)
+    """
+    successes = np.asarray(successes, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+    keep = totals > 0
+    successes, totals = successes[keep], totals[keep]
+    if len(totals) == 0:
+        raise ValueError("no run has any samples to resample")
+
+    picks = resample_runs(len(totals), n_resamples, rng)
+    drawn = rng.binomial(totals[picks], successes[picks] / totals[picks])
+    return drawn.sum(axis=1) / totals[picks].sum(axis=1)
+
+
+def bootstrap_mean(values, n_resamples, rng):
+    """
+    Resampled mean of one value per run.
+
+    :return: Mean of every resample, shape (n_resamples,)
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        raise ValueError("no values to resample")
+
+    picks = resample_runs(len(values), n_resamples, rng)
+    return values[picks].mean(axis=1)
+
+
+def percentile_interval(samples, confidence=DEFAULT_CONFIDENCE):
+    """
+    Percentile confidence interval along the resample axis (axis 0).
+
+    :return: (lower, upper), each shaped like one resample
+    """
+    tail = (1 - confidence) / 2 * 100
+    lower, upper = np.percentile(samples, [tail, 100 - tail], axis=0)
+    return lower, upper
@@ -0,0 +1,252 @@
+"""
+Single entry point for the analysis tools.
+
+    python3 -m f2fs_analysis sit-cdf sit_info.txt sit_info_predict.txt
+    python3 -m f2fs_analysis zombie leveldb/femu_stats.csv rocksdb/femu_stats.csv
+    python3 -m f2fs_analysis zombie-curve misc/femu_stats.csv.gz --zombie-only
+    python3 -m f2fs_analysis f2fs-metrics f2fs/metrics.csv.gz
+    python3 -m f2fs_analysis death-times bpftrace_output.csv --page 492
+    python3 -m f2fs_analysis death-times bpftrace_output.csv --density --log-y
+    python3 -m f2fs_analysis waf run*/results.txt --labels A A A B B B --bootstrap 2000
+    python3 -m f2fs_analysis collect --device nvme0n1 --mount /mnt/femu --output collector.csv
+
+Every subcommand accepts several inputs so a whole batch of experiment
+directories is processed in one interpreter. With --bootstrap, inputs that
+share a label are treated as repeated runs of one configuration and the
+plots get bootstrap confidence bands. Only argparse and the stdlib-only
+helpers in common.py are imported here; the module implementing a subcommand
+(and with it pandas / NumPy / matplotlib) is imported after the command line
+has been parsed, and only for that command.
+"""
+import argparse
+import importlib
+
+from .common import input_label, label_slug, policy_label
+
+# Subcommands that write one set of files per input, named after its label
+PER_INPUT_COMMANDS = {'zombie', 'zombie-curve', 'f2fs-metrics', 'death-times'}
+
+
+def _add_common_arguments(parser, input_help):
+    parser.add_argument('inputs', nargs='+', metavar='FILE', help=input_help)
+    parser.add_argument(
+        '--labels',
+        nargs='+',
+        help="One label per input, used in titles and output file names.\n"
+             "(Default: the name of the directory holding each input)"
+    )
+    parser.add_argument(
+        '--output-dir',
+        help="Directory for generated files.\n(Default: next to each input)"
+    )
+
+
+def _add_comparison_output_argument(parser, default_suffix):
+    parser.add_argument(
+        '--output',
+        help="File for the comparison plot.\n"
+             f"(Default: <labels>_{default_suffix} next to the first input or in --output-dir)"
+    )
+
+
+def _add_bootstrap_arguments(parser):
+    parser.add_argument(
+        '--bootstrap',
+        type=int,
+        metavar='RESAMPLES',
+        help="Treat inputs sharing a label as repeated runs and draw bootstrap\n"
+             "confidence bands from this many resamples (e.g. 2000)."
+    )
+    parser.add_argument(
+        '--confidence',
+        type=float,
+        default=0.95,
+        help="Confidence level of the bootstrap bands.\n(Default: 0.95)"
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help="Seed for the bootstrap random generator."
+    )
+
+
+def build_parser():
+    """
+    Builds the argument parser. Each subcommand records the handler it needs
+    as a 'module:function' string so nothing heavy is imported up front.
+    """
+    parser = argparse.ArgumentParser(
+        prog='f2fs_analysis',
+        description="Analysis and plotting tools for the F2FS zombie-block experiments.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    # --- sit-cdf (was parse_sit_info.py / parse_sit_info2.py) ---
+    sit_cdf = subparsers.add_parser(
+        'sit-cdf',
+        help="CDF of valid blocks per segment from F2FS SIT dumps.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    _add_common_arguments(sit_cdf, "F2FS segment summary (sit_info) files.")
+    sit_cdf.add_argument(
+        '--each',
+        action='store_true',
+        help="Write one CDF plot per input instead of a single comparison plot."
+    )
+    _add_comparison_output_argument(sit_cdf, 'vblock_cdf_comparison.png')
+    _add_bootstrap_arguments(sit_cdf)
+    sit_cdf.set_defaults(handler='sit_cdf:run')
+
+    # --- zombie (was cloudlab/zombie_curve.py) ---
+    zombie = subparsers.add_parser(
+        'zombie',
+        help="Invalid-ratio histogram of the final FEMU block state.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    _add_common_arguments(zombie, "FEMU block stats CSV files (femu_stats.csv[.gz]).")
+    _add_bootstrap_arguments(zombie)
+    zombie.set_defaults(handler='zombie:run_snapshot')
+
+    # --- zombie-curve (was cloudlab/zombie.py / sqlite_new/run.py) ---
+    zombie_curve = subparsers.add_parser(
+        'zombie-curve',
+        help="Evolution of hot / zombie / cold blocks across FEMU samples.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    _add_common_arguments(zombie_curve, "FEMU block stats CSV files (femu_stats.csv[.gz]).")
+    zombie_curve.add_argument(
+        '--zombie-only',
+        action='store_true',
+        help="Plot only the zombie curve, annotated with GC saturation and compaction."
+    )
+    zombie_curve.set_defaults(handler='zombie:run_curve')
+
+    # --- f2fs-metrics (was f2fs/pot.py) ---
+    f2fs_metrics = subparsers.add_parser(
+        'f2fs-metrics',
+        help="Fragmentation, GC and free-space graphs from workload.sh metrics.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    _add_common_arguments(f2fs_metrics, "metrics.csv[.gz] files or 'collect' logs from f2fs/workload.sh.")
+    f2fs_metrics.set_defaults(handler='f2fs_metrics:run')
+
+    # --- death-times (was suppporting_experiments/*.py) ---
+    death_times = subparsers.add_parser(
+        'death-times',
+        help="Death-time plots from bpftrace f2fs_writepage traces.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    _add_common_arguments(death_times, "bpftrace CSV files (page_index, death_time_ms, timestamp).")
+    death_times.add_argument(
+        '--page',
+        type=int,
+        help="Plot death time against trace time for this page (chunk) index only."
+    )
+    death_times.add_argument(
+        '--density',
+        action='store_true',
+        help="Stream the trace into 2-D histograms and draw heatmaps instead of\n"
+             "scatter plots; cost stays constant for any trace length."
+    )
+    death_times.add_argument(
+        '--bins',
+        nargs=2,
+        type=int,
+        default=[400, 200],
+        metavar=('X', 'Y'),
+        help="Number of x and death-time bins for --density.\n(Default: 400 200)"
+    )
+    death_times.add_argument(
+        '--log-y',
+        action='store_true',
+        help="Use log-spaced death-time bins and a log axis with --density\n"
+             "(always on with --page)."
+    )
+    death_times.set_defaults(handler='death_times:run')
+
+    # --- waf (results.txt / vm_scripts/waf.sh output) ---
+    waf = subparsers.add_parser(
+        'waf',
+        help="Write amplification per configuration from results.txt files.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    _add_common_arguments(waf, "Files containing a 'WAF:' or 'Write Amplification:' line.")
+    _add_comparison_output_argument(waf, 'waf_comparison.png')
+    _add_bootstrap_arguments(waf)
+    waf.set_defaults(handler='waf:run')
+
+    # --- collect (replaces the polling steps of f2fs/workload.sh) ---
+    collect = subparsers.add_parser(
+        'collect',
+        help="Sample F2FS status, GC trace events and disk stats into one log.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    collect.add_argument('--output', required=True, help="CSV log to append samples to.")
+    collect.add_argument('--device', help="Block device to sample, e.g. nvme0n1 or /dev/nvme0n1.")
+    collect.add_argument('--mount', help="Mount point whose disk usage is added to status samples.")
+    collect.add_argument(
+        '--status-path',
+        default='/sys/kernel/debug/f2fs/status',
+        help="F2FS status file.\n(Default: /sys/kernel/debug/f2fs/status)"
+    )
+    collect.add_argument(
+        '--trace-path',
+        default='/sys/kernel/debug/tracing/trace_pipe',
+        help="ftrace pipe to count f2fs_gc_begin / f2fs_gc_end events from.\n"
+             "(Default: /sys/kernel/debug/tracing/trace_pipe)"
+    )
+    collect.add_argument('--stat-path', help="Block-device stat file.\n(Default: /sys/block/<device>/stat)")
+    collect.add_argument('--no-status', action='store_true', help="Do not sample the status file.")
+    collect.add_argument('--no-trace', action='store_true', help="Do not follow the trace pipe.")
+    collect.add_argument('--status-interval', type=float, default=1.0, help="Seconds between status samples.")
+    collect.add_argument('--disk-interval', type=float, default=1.0, help="Seconds between disk stat samples.")
+    collect.add_argument('--trace-interval', type=float, default=1.0, help="Seconds between GC count samples.")
+    collect.add_argument('--flush-interval', type=float, default=5.0, help="Seconds between log flushes.")
+    collect.add_argument('--duration', type=float, help="Stop after this many seconds.\n(Default: until SIGINT / SIGTERM)")
+    collect.set_defaults(handler='collector:run')
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Parses the command line, then imports and runs the selected subcommand.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if 'labels' in args and args.labels is not None and len(args.labels) != len(args.inputs):
+        parser.error(f"got {len(args.labels)} labels for {len(args.inputs)} inputs")
+    if 'bootstrap' in args:
+        if args.bootstrap is not None and args.bootstrap < 1:
+            parser.error("--bootstrap needs at least one resample")
+        if not 0 < args.confidence < 1:
+            parser.error("--confidence must be between 0 and 1")
+    if 'bins' in args and min(args.bins) < 1:
+        parser.error("--bins needs at least one bin per axis")
+    if args.command == 'collect':
+        intervals = (args.status_interval, args.disk_interval, args.trace_interval, args.flush_interval)
+        if min(intervals) <= 0:
+            parser.error("intervals must be positive")
+
+    if 'output_dir' in args and args.output_dir is not None:
+        # Files are named after the label, so in one shared directory two inputs
+        # with the same label would overwrite each other
+        names = None
+        if args.command in PER_INPUT_COMMANDS and not getattr(args, 'bootstrap', None):
+            names = args.labels or [input_label(p) for p in args.inputs]
+        elif args.command == 'sit-cdf' and args.each and not args.bootstrap:
+            names = [label_slug(label) for label in args.labels or [policy_label(p) for p in args.inputs]]
+        duplicates = sorted({name for name in names or [] if names.count(name) > 1})
+        if duplicates:
+            parser.error(f"inputs named {', '.join(duplicates)} would overwrite each other "
+                         "in --output-dir; pass distinct --labels")
+
+    module_name, func_name = args.handler.split(':')
+    module = importlib.import_module(f'.{module_name}', __package__)
+    return getattr(module, func_name)(args)
+
+
+if __name__ == "__main__":
+    main()
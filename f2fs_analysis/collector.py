@@ -0,0 +1,354 @@
+"""
+collect: low-overhead metrics collector to run alongside a workload.
+
+One asyncio loop samples the F2FS status file, the block-device stat file and
+(optionally) the mount's disk usage on their own schedules, while a reader
+thread follows the ftrace pipe and counts GC events. Every sample is a row
+of one append-only CSV with fixed columns; rows are queued and written in
+batches. No child processes are forked, unlike the cp / grep / cat / df
+calls of the shell polling loops this replaces.
+
+The source paths are plain options so the collector can run against fixture
+files standing in for debugfs and sysfs:
+
+    python3 -m f2fs_analysis collect --output run.csv --duration 5 \\
+        --status-path f2fs/status_1.txt --trace-path trace.txt --stat-path stat.txt
+
+Stdlib only: this runs on the VM under test, where pandas may not exist.
+"""
+import asyncio
+import os
+import re
+import signal
+import threading
+import time
+
+COLUMNS = [
+    'timestamp', 'elapsed_s', 'source',
+    # status
+    'utilization', 'valid_blocks', 'valid_segs', 'dirty_segs', 'prefree_segs', 'free_segs',
+    'gc_calls', 'bg_gc_calls', 'disk_percent',
+    # trace (cumulative event counts)
+    'gc_begin', 'gc_end',
+    # disk (cumulative, from /sys/block/<dev>/stat)
+    'read_ios', 'sectors_read', 'write_ios', 'sectors_written',
+]
+
+STATUS_PATTERNS = {
+    'utilization': re.compile(r'^Utilization:\s*(\d+)%', re.MULTILINE),
+    'valid_blocks': re.compile(r'^Utilization:\s*\d+%\s*\((\d+) valid blocks', re.MULTILINE),
+    'valid_segs': re.compile(r'^\s*- Valid:\s*(\d+)', re.MULTILINE),
+    'dirty_segs': re.compile(r'^\s*- Dirty:\s*(\d+)', re.MULTILINE),
+    'prefree_segs': re.compile(r'^\s*- Prefree:\s*(\d+)', re.MULTILINE),
+    'free_segs': re.compile(r'^\s*- Free:\s*(\d+)', re.MULTILINE),
+    'gc_calls': re.compile(r'^GC calls:\s*(\d+)', re.MULTILINE),
+    'bg_gc_calls': re.compile(r'^GC calls:\s*\d+\s*\(BG:\s*(\d+)\)', re.MULTILINE),
+}
+
+# ftrace event name -> column holding its running count
+TRACE_EVENTS = {
+    'f2fs_gc_begin': 'gc_begin',
+    'f2fs_gc_end': 'gc_end',
+}
+
+# Field positions in /sys/block/<dev>/stat (Documentation/block/stat.rst)
+DISK_STAT_FIELDS = {
+    'read_ios': 0,
+    'sectors_read': 2,
+    'write_ios': 4,
+    'sectors_written': 6,
+}
+
+
+def read_file(path):
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def parse_status(text):
+    """
+    Picks the segment and GC counters out of an F2FS status dump.
+    """
+    row = {}
+    for column, pattern in STATUS_PATTERNS.items():
+        match = pattern.search(text)
+        if match:
+            row[column] = int(match.group(1))
+    return row
+
+
+def parse_disk_stat(text):
+    """
+    Cumulative I/O counters from a block-device stat line.
+    """
+    fields = text.split()
+    return {column: int(fields[i]) for column, i in DISK_STAT_FIELDS.items() if i < len(fields)}
+
+
+def disk_percent(mount_point):
+    """
+    Used space of the mount in percent, as workload.sh computed it from df.
+    """
+    st = os.statvfs(mount_point)
+    if st.f_blocks == 0:
+        return 0
+    return (st.f_blocks - st.f_bfree) * 100 // st.f_blocks
+
+
+class TraceCounter:
+    """
+    Follows the trace pipe on a daemon thread and counts GC events.
+
+    trace_pipe blocks until events arrive; a regular (fixture) file is
+    followed like 'tail -f'. Reading the pipe consumes the events, so
+    nothing is lost when the ring buffer wraps.
+    """
+
+    def __init__(self, path, poll_interval=0.05):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.counts = dict.fromkeys(TRACE_EVENTS.values(), 0)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._file = None
+        self._thread = threading.Thread(target=self._follow, name='trace-counter', daemon=True)
+
+    def start(self):
+        # Opened here so a missing path fails in the caller, not the thread
+        self._file = open(self.path, 'r', errors='replace')
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.counts)
+
+    def _follow(self):
+        with self._file as f:
+            while not self._stop.is_set():
+                line = f.readline()
+                if not line:
+                    time.sleep(self.poll_interval)
+                    continue
+                for event, column in TRACE_EVENTS.items():
+                    if event in line:
+                        with self._lock:
+                            self.counts[column] += 1
+                        break
+
+
+class Collector:
+    """
+    Runs the samplers and the batched writer until stopped.
+    """
+
+    def __init__(self, output, status_path=None, stat_path=None, trace_path=None, mount_point=None,
+                 status_interval=1.0, disk_interval=1.0, trace_interval=1.0,
+                 flush_interval=5.0, batch_rows=256):
+        self.output = output
+        self.status_path = status_path
+        self.stat_path = stat_path
+        self.trace_path = trace_path
+        self.mount_point = mount_point
+        self.status_interval = status_interval
+        self.disk_interval = disk_interval
+        self.trace_interval = trace_interval
+        self.flush_interval = flush_interval
+        self.batch_rows = batch_rows
+
+        self.rows_written = 0
+        self._start = None
+        self._queue = None
+        self._stop = None
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    def _emit(self, source, values):
+        row = {'timestamp': f'{time.time():.3f}',
+               'elapsed_s': f'{time.monotonic() - self._start:.3f}',
+               'source': source}
+        row.update(values)
+        self._queue.put_nowait(row)
+
+    async def _every(self, interval, sample):
+        """
+        Calls sample() on a fixed schedule (start + k * interval), so slow
+        samples do not make the timing drift.
+        """
+        next_at = time.monotonic()
+        failing = False
+        while not self._stop.is_set():
+            try:
+                await sample()
+                if failing:
+                    print("Sampling recovered.")
+                failing = False
+            except (OSError, ValueError) as e:
+                # Sources were checked at startup; report a later read or parse
+                # failure (e.g. a transient unmount) once, not on every tick
+                if not failing:
+                    print(f"Sampling failed: {e}")
+                failing = True
+            next_at += interval
+            delay = next_at - time.monotonic()
+            if delay < 0:
+                # Fell behind: skip the missed ticks instead of bursting
+                next_at = time.monotonic()
+                delay = 0
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _sample_status(self):
+        row = parse_status(await asyncio.to_thread(read_file, self.status_path))
+        if self.mount_point is not None:
+            row['disk_percent'] = disk_percent(self.mount_point)
+        self._emit('status', row)
+
+    async def _sample_disk(self):
+        self._emit('disk', parse_disk_stat(await asyncio.to_thread(read_file, self.stat_path)))
+
+    def _open_output(self):
+        """
+        Opens the log for appending, writing the header to a new file.
+        """
+        f = open(self.output, 'a')
+        if f.tell() == 0:
+            f.write(','.join(COLUMNS) + '\n')
+            f.flush()
+        return f
+
+    def _check_sources(self):
+        """
+        Reads and parses every configured source once, so a mistyped device,
+        an unmounted debugfs or a file in the wrong format fails at startup
+        instead of on every tick.
+        """
+        if self.status_path is not None and not parse_status(read_file(self.status_path)):
+            raise ValueError(f"{self.status_path} is not an F2FS status file")
+        if self.stat_path is not None:
+            try:
+                stats = parse_disk_stat(read_file(self.stat_path))
+            except ValueError:
+                stats = {}
+            if len(stats) < len(DISK_STAT_FIELDS):
+                raise ValueError(f"{self.stat_path} is not a block-device stat file")
+        if self.mount_point is not None:
+            disk_percent(self.mount_point)
+
+    async def _writer(self, f):
+        """
+        Drains the queue into the log, flushing every flush_interval seconds
+        or batch_rows rows, and once more on shutdown.
+        """
+        with f:
+            pending = 0
+            last_flush = time.monotonic()
+            while True:
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    row = {}
+
+                # None is queued by run() once every sampler has finished
+                if row is None:
+                    break
+
+                if row:
+                    f.write(','.join(str(row.get(column, '')) for column in COLUMNS) + '\n')
+                    pending += 1
+                    self.rows_written += 1
+
+                if pending and (pending >= self.batch_rows
+                                or time.monotonic() - last_flush >= self.flush_interval):
+                    f.flush()
+                    pending = 0
+                    last_flush = time.monotonic()
+            f.flush()
+
+    async def run(self, duration=None):
+        self._start = time.monotonic()
+        self._queue = asyncio.Queue()
+        self._stop = asyncio.Event()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        # Everything that can fail on a bad path happens before scheduling
+        output = self._open_output()
+        try:
+            self._check_sources()
+            trace_counter = None
+            if self.trace_path is not None:
+                trace_counter = TraceCounter(self.trace_path)
+                trace_counter.start()
+        except (OSError, ValueError):
+            output.close()
+            raise
+
+        samplers = []
+        if self.status_path is not None:
+            samplers.append(self._every(self.status_interval, self._sample_status))
+        if self.stat_path is not None:
+            samplers.append(self._every(self.disk_interval, self._sample_disk))
+        if trace_counter is not None:
+            async def sample_trace():
+                self._emit('trace', trace_counter.snapshot())
+
+            samplers.append(self._every(self.trace_interval, sample_trace))
+
+        if duration is not None:
+            loop.call_later(duration, self.stop)
+
+        writer = asyncio.create_task(self._writer(output))
+        # If writing fails mid-run (e.g. disk full), stop sampling right away
+        writer.add_done_callback(lambda task: task.cancelled() or task.exception() is None or self.stop())
+        try:
+            await asyncio.gather(*samplers)
+        finally:
+            self.stop()
+            if trace_counter is not None:
+                trace_counter.stop()
+            self._queue.put_nowait(None)
+            await writer
+
+
+def run(args):
+    """
+    Entry point for 'collect'.
+    """
+    stat_path = args.stat_path
+    if stat_path is None and args.device is not None:
+        stat_path = f"/sys/block/{os.path.basename(args.device)}/stat"
+
+    collector = Collector(
+        args.output,
+        status_path=None if args.no_status else args.status_path,
+        stat_path=stat_path,
+        trace_path=None if args.no_trace else args.trace_path,
+        mount_point=args.mount,
+        status_interval=args.status_interval,
+        disk_interval=args.disk_interval,
+        trace_interval=args.trace_interval,
+        flush_interval=args.flush_interval,
+    )
+
+    print(f"Collecting to {args.output} (Ctrl+C or SIGTERM to stop)...")
+    try:
+        asyncio.run(collector.run(args.duration))
+    except FileNotFoundError as e:
+        print(f"Error: Could not find file {e.filename}")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(f"Wrote {collector.rows_written} rows to {args.output}")
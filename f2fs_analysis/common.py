@@ -0,0 +1,94 @@
+"""
+Small helpers shared by the subcommands. Kept free of pandas / NumPy / matplotlib
+so that importing it never pays for the heavy modules.
+"""
+import gzip
+import os
+import re
+
+
+def open_text(file_path):
+    """
+    Opens a (possibly gzip-compressed) text file for reading.
+    """
+    if file_path.endswith('.gz'):
+        return gzip.open(file_path, 'rt')
+    return open(file_path, 'r')
+
+
+def input_label(file_path):
+    """
+    Default label for an input: the name of the experiment directory holding it,
+    e.g. 'leveldb/femu_stats.csv' -> 'leveldb'.
+    """
+    parent = os.path.basename(os.path.dirname(os.path.abspath(file_path)))
+    if parent:
+        return parent
+    return os.path.basename(file_path).split('.')[0]
+
+
+# Legend labels for the SIT dump file names used by the death-time prediction runs
+POLICY_LABELS = {
+    "sit_info.txt": "Default policies",
+    "sit_info_predict.txt": "With death-time prediction",
+}
+
+
+def policy_label(file_path):
+    """
+    Default label for a SIT dump: the policy name for the known dump file names,
+    otherwise the name of the experiment directory.
+    """
+    return POLICY_LABELS.get(os.path.basename(file_path), input_label(file_path))
+
+
+def label_slug(label):
+    """
+    Label made safe for a file name, e.g. 'Default policies' -> 'Default-policies'.
+    """
+    return re.sub(r'[^A-Za-z0-9.]+', '-', label).strip('-')
+
+
+def labelled_inputs(inputs, labels=None):
+    """
+    Pairs every input path with its label, falling back to input_label().
+    """
+    if labels is None:
+        labels = [input_label(p) for p in inputs]
+    return list(zip(inputs, labels))
+
+
+def output_path(file_path, label, suffix, output_dir=None):
+    """
+    Builds '<dir>/<label>_<suffix>', where <dir> is output_dir if given and the
+    directory of the input file otherwise. With output_dir, inputs must have
+    distinct labels or they overwrite each other; cli.main() checks that.
+    """
+    if output_dir is None:
+        output_dir = os.path.dirname(file_path) or '.'
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f'{label}_{suffix}')
+
+
+def comparison_path(file_path, labels, suffix, output=None, output_dir=None):
+    """
+    Output file of a plot that compares several labels: 'output' if given,
+    otherwise output_path() named after the compared labels, e.g.
+    'Default-policies_vs_With-death-time-prediction_vblock_cdf_comparison.png'.
+    """
+    if output is not None:
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        return output
+    slugs = [label_slug(label) for label in dict.fromkeys(labels)]
+    return output_path(file_path, '_vs_'.join(slugs), suffix, output_dir)
+
+
+def group_by_label(labelled):
+    """
+    Groups (path, label) pairs into configurations: inputs sharing a label
+    are repeated runs of the same configuration. Keeps first-seen order.
+    """
+    groups = {}
+    for file_path, label in labelled:
+        groups.setdefault(label, []).append(file_path)
+    return list(groups.items())
@@ -0,0 +1,206 @@
+"""
+death-times: plots of page death times traced by the bpftrace scripts in
+suppporting_experiments/ (columns inode, page_index, death_time_ms, timestamp).
+
+With --density the trace is streamed in chunks into fixed 2-D histograms and
+rendered as heatmaps, so plot time and memory do not grow with trace length.
+"""
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+
+from .common import labelled_inputs, output_path
+
+CHUNK_ROWS = 1_000_000
+
+# x column of each density view -> (axis label, scale to plotted unit, output suffix)
+DENSITY_VIEWS = {
+    'page_index': ("Logical File Offset", 1, 'death_times_density.png'),
+    'timestamp': ("Time (s)", 1 / 1000, 'death_times_over_time_density.png'),
+}
+
+
+def read_trace(file_path):
+    """
+    Loads a bpftrace CSV; the data rows are written as '<a>, <b>, ...'.
+    """
+    return pd.read_csv(file_path, skipinitialspace=True)
+
+
+def plot_all_death_times(df, label, output_file):
+    """
+    Death time of every traced write against its logical file offset.
+    """
+    plt.figure()
+    plt.scatter(df['page_index'], df['death_time_ms'], s=10)
+
+    plt.xlabel("Logical File Offset")
+    plt.ylabel("Death Time (ms)")
+    plt.title(f"Distribution of Death Times ({label})")
+
+    plt.savefig(output_file)
+    plt.close()
+
+
+def plot_page_death_times(df, page_idx, label, output_file):
+    """
+    Variation of the death time of a single page (chunk) over the trace.
+    """
+    page_df = df[df['page_index'] == page_idx].sort_values(by='timestamp')
+
+    plt.figure()
+    plt.scatter(page_df['timestamp']/1000, page_df['death_time_ms'], s=20)
+
+    plt.xlabel("Time (s)")
+    plt.ylabel("Death Time (ms)")
+    plt.title(f"Variation of Death Times for chunk {page_idx} ({label})", {'fontsize': 11})
+    plt.yscale('log', base=10)
+
+    plt.savefig(output_file)
+    plt.close()
+
+
+def iter_trace_chunks(file_path, page_idx=None):
+    """
+    Yields the trace in chunks of CHUNK_ROWS rows, optionally for one page only.
+    """
+    columns = ['page_index', 'death_time_ms', 'timestamp']
+    for chunk in pd.read_csv(file_path, skipinitialspace=True, usecols=columns, chunksize=CHUNK_ROWS):
+        if page_idx is not None:
+            chunk = chunk[chunk['page_index'] == page_idx]
+        yield chunk
+
+
+def bin_edges(low, high, n_bins, log=False):
+    """
+    n_bins + 1 edges covering [low, high], geometrically spaced when log is set.
+    """
+    if high <= low:
+        high = low * 10 if log else low + 1
+    if log:
+        return np.geomspace(low, high, n_bins + 1)
+    return np.linspace(low, high, n_bins + 1)
+
+
+def density_histograms(file_path, x_columns, bins, log_y, page_idx=None):
+    """
+    Streams the trace twice: once for the axis ranges, once to accumulate one
+    (x, death_time_ms) 2-D histogram per x column. Memory is bounded by the
+    chunk size and the number of bins.
+
+    :return: (dict x column -> (counts, x_edges), y_edges, rows), or None if empty
+    """
+    y = 'death_time_ms'
+    lows = dict.fromkeys(x_columns + [y], np.inf)
+    highs = dict.fromkeys(x_columns + [y], -np.inf)
+
+    # Pass 1: ranges. A log axis only covers positive death times.
+    for chunk in iter_trace_chunks(file_path, page_idx):
+        if log_y:
+            chunk = chunk[chunk[y] > 0]
+        for column in lows:
+            if len(chunk):
+                lows[column] = min(lows[column], chunk[column].min())
+                highs[column] = max(highs[column], chunk[column].max())
+
+    if not np.isfinite(lows[y]):
+        return None
+
+    n_x, n_y = bins
+    y_edges = bin_edges(lows[y], highs[y], n_y, log=log_y)
+    x_edges = {column: bin_edges(lows[column], highs[column], n_x) for column in x_columns}
+    counts = {column: np.zeros((n_x, n_y), dtype=np.int64) for column in x_columns}
+
+    # Pass 2: accumulate
+    rows = 0
+    for chunk in iter_trace_chunks(file_path, page_idx):
+        if log_y:
+            chunk = chunk[chunk[y] > 0]
+        rows += len(chunk)
+        for column in x_columns:
+            hist, _, _ = np.histogram2d(chunk[column], chunk[y], bins=[x_edges[column], y_edges])
+            counts[column] += hist.astype(np.int64)
+
+    return {column: (counts[column], x_edges[column]) for column in x_columns}, y_edges, rows
+
+
+def plot_density(counts, x_edges, y_edges, xlabel, title, log_y, output_file):
+    """
+    Heatmap of a 2-D histogram; empty bins are left blank.
+    """
+    plt.figure(figsize=(10, 6))
+    mesh = plt.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts, 0).T,
+                          norm=LogNorm(), cmap='viridis', shading='flat')
+    plt.colorbar(mesh, label="Writes per bin")
+
+    plt.xlabel(xlabel)
+    plt.ylabel("Death Time (ms)")
+    plt.title(title, {'fontsize': 11})
+    if log_y:
+        plt.yscale('log', base=10)
+
+    plt.tight_layout()
+    plt.savefig(output_file)
+    plt.close()
+
+
+def run_density(args, file_path, label):
+    """
+    'death-times --density' for one trace.
+    """
+    # Per-page views keep the log death-time axis of the scatter version
+    log_y = args.log_y or args.page is not None
+    x_columns = ['timestamp'] if args.page is not None else list(DENSITY_VIEWS)
+
+    result = density_histograms(file_path, x_columns, args.bins, log_y, args.page)
+    if result is None:
+        print(f"No death times to plot in {file_path}.")
+        return
+    histograms, y_edges, rows = result
+    print(f"Binned {rows} writes into {args.bins[0]}x{args.bins[1]} bins.")
+
+    for column, (counts, x_edges) in histograms.items():
+        xlabel, scale, suffix = DENSITY_VIEWS[column]
+        if args.page is None:
+            title = f"Density of Death Times ({label})"
+        else:
+            title = f"Density of Death Times for chunk {args.page} ({label})"
+            suffix = f'page{args.page}_temporal_locality_density.png'
+        output_file = output_path(file_path, label, suffix, args.output_dir)
+        plot_density(counts, x_edges * scale, y_edges, xlabel, title, log_y, output_file)
+        print(f"Saved: {output_file}")
+
+
+def run_scatter(args, file_path, label):
+    """
+    'death-times' scatter plots for one trace.
+    """
+    df = read_trace(file_path)
+
+    if args.page is None:
+        output_file = output_path(file_path, label, 'death_times.png', args.output_dir)
+        plot_all_death_times(df, label, output_file)
+    else:
+        output_file = output_path(file_path, label, f'page{args.page}_temporal_locality.png', args.output_dir)
+        plot_page_death_times(df, args.page, label, output_file)
+    print(f"Saved: {output_file}")
+
+
+def run(args):
+    """
+    Entry point for 'death-times'. A missing or wrong-schema trace is
+    reported and skipped so the rest of the batch still runs.
+    """
+    for file_path, label in labelled_inputs(args.inputs, args.labels):
+        print(f"Reading {file_path}...")
+        try:
+            if args.density:
+                run_density(args, file_path, label)
+            else:
+                run_scatter(args, file_path, label)
+        except FileNotFoundError:
+            print(f"Error: Could not find file {file_path}")
+        except (KeyError, ValueError) as e:
+            # KeyError: missing column; ValueError: usecols not in the header
+            print(f"Skipping {file_path}: not a bpftrace death-time CSV ({e})")
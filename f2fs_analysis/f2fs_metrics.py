@@ -0,0 +1,167 @@
+"""
+f2fs-metrics: fragmentation, GC and free-space graphs from the per-round
+metrics.csv written by older runs of f2fs/workload.sh, or from the log of
+the 'collect' subcommand.
+"""
+import csv
+
+import matplotlib.pyplot as plt
+
+from .common import labelled_inputs, open_text, output_path
+
+# Columns of the per-round metrics.csv that the graphs use
+REQUIRED_COLUMNS = ['Round', 'Disk_Percent', 'Dirty_Segs', 'Free_Segs', 'GC_Events', 'Physical_MB']
+
+
+def clean_int(value):
+    """
+    Helper to turn '8060(8060)' into integer 8060.
+    """
+    if not value: return 0
+    # Split by '(' to handle cases like "8060(8060)" and take the first part
+    clean_val = value.split('(')[0]
+    return int(clean_val)
+
+
+def empty_metrics():
+    return {
+        'rounds': [],
+        'disk_pct': [],
+        'dirty_segs': [],
+        'free_segs': [],
+        'gc_events': [],
+        'physical_mb': [],
+    }
+
+
+def read_collector_log(reader):
+    """
+    Turns a collector log into the graph columns: one point per status sample,
+    with the latest GC count and written sectors seen before it. The x value
+    is the mount's disk usage, or F2FS's own utilization for logs collected
+    without --mount.
+    """
+    metrics = empty_metrics()
+    gc_events = 0
+    first_sectors = None
+    sectors = None
+
+    for row in reader:
+        source = row['source']
+        if source == 'trace' and row['gc_begin']:
+            gc_events = int(row['gc_begin'])
+        elif source == 'disk' and row['sectors_written']:
+            sectors = int(row['sectors_written'])
+            if first_sectors is None:
+                first_sectors = sectors
+        elif source == 'status' and row['dirty_segs']:
+            percent = row['disk_percent'] or row['utilization']
+            if not percent:
+                continue
+            physical_mb = 0 if sectors is None else (sectors - first_sectors) * 512 // 1024 // 1024
+            values = (
+                len(metrics['rounds']) + 1,
+                int(percent),
+                int(row['dirty_segs']),
+                int(row['free_segs']),
+                gc_events,
+                physical_mb,
+            )
+            for column, value in zip(metrics, values):
+                metrics[column].append(value)
+
+    return metrics
+
+
+def read_metrics(file_path):
+    """
+    Reads the per-round columns used by the graphs, skipping the summary rows.
+    Returns None (after saying why) when the file is neither a metrics.csv nor
+    a collector log, so one bad input does not abort a batch.
+    """
+    metrics = empty_metrics()
+
+    with open_text(file_path) as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        if 'source' in fieldnames:
+            return read_collector_log(reader)
+
+        missing = [column for column in REQUIRED_COLUMNS if column not in fieldnames]
+        if missing:
+            print(f"Skipping {file_path}: missing columns {', '.join(missing)}")
+            return None
+
+        for row in reader:
+            # Skip the "Final" summary line if it exists
+            if row['Round'] == 'Final' or row['Round'] == 'HANG':
+                continue
+
+            try:
+                values = (
+                    int(row['Round']),
+                    int(row['Disk_Percent']),
+                    clean_int(row['Dirty_Segs']),
+                    clean_int(row['Free_Segs']),
+                    int(row['GC_Events']),
+                    int(row['Physical_MB']),
+                )
+            except ValueError as e:
+                print(f"Skipping malformed row: {row} - Error: {e}")
+                continue
+
+            for column, value in zip(metrics, values):
+                metrics[column].append(value)
+
+    return metrics
+
+
+def plot_metric(disk_pct, values, label, color, ylabel, title, output_file, minor_grid=False):
+    """
+    One metric against disk utilization.
+    """
+    plt.figure(figsize=(10, 6))
+    plt.plot(disk_pct, values, label=label, color=color, linewidth=2)
+    plt.xlabel('Disk Utilization (%)')
+    plt.ylabel(ylabel)
+    plt.title(title)
+    plt.grid(True, which='both' if minor_grid else 'major', linestyle='--', alpha=0.7)
+    plt.legend()
+    plt.savefig(output_file)
+    plt.close()
+    print(f"Saved {output_file}")
+
+
+def run(args):
+    """
+    Entry point for 'f2fs-metrics'.
+    """
+    for file_path, label in labelled_inputs(args.inputs, args.labels):
+        try:
+            metrics = read_metrics(file_path)
+        except FileNotFoundError:
+            print(f"Error: Could not find file {file_path}")
+            continue
+        if metrics is None:
+            continue
+        if not metrics['rounds']:
+            print(f"Skipping {file_path}: no status samples to plot")
+            continue
+
+        disk_pct = metrics['disk_pct']
+
+        # 1. Plot A: Dirty Segments (The Zombie Curve)
+        plot_metric(disk_pct, metrics['dirty_segs'], 'Dirty Segments', 'orange',
+                    'Count of Dirty Segments', f'{label}: Internal Fragmentation vs Disk Usage',
+                    output_path(file_path, label, 'fragmentation.png', args.output_dir),
+                    minor_grid=True)
+
+        # 2. Plot B: GC Events (System Stress)
+        plot_metric(disk_pct, metrics['gc_events'], 'GC Events', 'red',
+                    'Cumulative GC Events', f'{label}: Garbage Collection Overhead',
+                    output_path(file_path, label, 'gc_stress.png', args.output_dir))
+
+        # 3. Plot C: Free Segments (Efficiency)
+        plot_metric(disk_pct, metrics['free_segs'], 'Free Segments', 'green',
+                    'Free Segments Available', f'{label}: Free Space Availability',
+                    output_path(file_path, label, 'free_space.png', args.output_dir))
@@ -0,0 +1,313 @@
+"""
+sit-cdf: CDF of valid blocks per segment, parsed from F2FS segment summary dumps.
+"""
+import re
+import math
+import os
+from collections import Counter
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .bootstrap import bootstrap_histograms, percentile_interval
+from .common import comparison_path, group_by_label, label_slug, output_path, policy_label
+
+# --- Configuration ---
+MAX_VBLOCKS = 512
+PARTITION_SIZE_PERCENT = 2
+OUTPUT_CDF_SUFFIX = "vblock_cdf_comparison.png"
+BIN_EDGES = np.linspace(0, 100, math.ceil(100 / PARTITION_SIZE_PERCENT) + 1)
+
+PLOT_STYLES = [
+    ('o', '#3498db'),
+    ('s', '#e74c3c'),
+    ('^', '#2ecc71'),
+    ('d', '#f39c12'),
+]
+
+
+def parse_f2fs_summary(file_path):
+    """
+    Reads summary data from the specified file path, parses lines, and filters entries.
+    """
+
+    if not os.path.exists(file_path):
+        print(f"❌ Error: File not found at '{file_path}'")
+        return None, 0
+
+    # Regular expression to capture the required fields: Segment no.: <segno>, Valid: <vblocks>, type: <seg_type>
+    pattern = re.compile(
+        r'Segment no.:\s*(?P<segno>\d+)'
+        r'.*Valid:\s*(?P<vblocks>\d+)'
+        r'.*type:\s*(?P<seg_type>\d+)'
+    )
+
+    filtered_vblock_percentages = []
+    total_lines_read = 0
+    valid_seg_types = {0, 1, 2}
+
+    try:
+        with open(file_path, 'r') as f:
+            for line in f:
+                total_lines_read += 1
+                match = pattern.search(line)
+
+                if match:
+                    vblocks = int(match.group('vblocks'))
+                    seg_type = int(match.group('seg_type'))
+
+                    if seg_type in valid_seg_types:
+                        vblocks_clamped = min(vblocks, MAX_VBLOCKS)
+                        vblock_percent = (vblocks_clamped / MAX_VBLOCKS) * 100
+                        filtered_vblock_percentages.append(vblock_percent)
+
+    except Exception as e:
+        print(f"An error occurred while reading or processing the file: {e}")
+        return None, 0
+
+    return filtered_vblock_percentages, total_lines_read
+
+
+def create_histogram(percentages, partition_size):
+    """
+    Creates a standard frequency histogram and returns the raw sorted bins.
+    """
+
+    bin_counts = Counter()
+    last_bin = math.ceil(100 / partition_size) - 1
+
+    for p in percentages:
+        # 100% lands in the last bin rather than opening a bin of its own
+        bin_index = max(0, min(last_bin, math.floor(p / partition_size)))
+        bin_start = bin_index * partition_size
+        bin_counts[bin_start] += 1
+
+    # Create sorted list of (start_percent, count) tuples
+    return sorted(bin_counts.items())
+
+
+def create_cumulative_distribution(sorted_bins, total_segments):
+    """
+    Converts the sorted histogram bins into cumulative PERCENTAGES.
+    """
+    cumulative_percentages = {}
+    current_cumulative_count = 0
+
+    if total_segments == 0:
+        return cumulative_percentages
+
+    for start_percent, count in sorted_bins:
+        current_cumulative_count += count
+
+        # Calculate the cumulative percentage
+        cumulative_pct = (current_cumulative_count / total_segments) * 100
+
+        # The x-axis point for a CDF is the END of the bin (e.g., 5%, 10%, etc.)
+        end_percent = min(start_percent + PARTITION_SIZE_PERCENT, 100)
+
+        cumulative_percentages[end_percent] = cumulative_pct
+
+    return cumulative_percentages
+
+
+def histogram_counts(percentages):
+    """
+    Segment counts per bin as an array, for the bootstrap. Same bins as create_histogram().
+    """
+    counts, _ = np.histogram(percentages, bins=BIN_EDGES)
+    return counts
+
+
+def bootstrap_cdf_band(run_counts, n_resamples, confidence, rng):
+    """
+    Bootstrap confidence band of the pooled CDF of several runs.
+
+    :param run_counts: Per-run bin counts, shape (n_runs, n_bins)
+    :return: (lower, upper) dicts mapping bin end to cumulative percentage
+    """
+    resampled = bootstrap_histograms(run_counts, n_resamples, rng)
+    cdfs = resampled.cumsum(axis=1) / resampled.sum(axis=1, keepdims=True) * 100
+    lower, upper = percentile_interval(cdfs, confidence)
+    ends = BIN_EDGES[1:]
+    return dict(zip(ends, lower)), dict(zip(ends, upper))
+
+
+def plot_cumulative_comparison(all_cdf_data, output_file, bands=None):
+    """
+    Generates and saves a line plot of one or more Cumulative Distribution Functions (CDFs)
+    on the same graph for comparison.
+
+    :param all_cdf_data: List of tuples, where each tuple is (label, cdf_data_dict)
+    :param bands: Optional list of (lower, upper) dicts aligned with all_cdf_data,
+                  drawn as shaded confidence bands around each CDF
+    """
+    if not all_cdf_data:
+        print("No data to plot.")
+        return
+
+    plt.figure(figsize=(10, 6))
+
+    for i, (label, cdf_data) in enumerate(all_cdf_data):
+        marker, color = PLOT_STYLES[i % len(PLOT_STYLES)]
+
+        percentages = sorted(cdf_data.keys())
+        cumulative_pcts = [cdf_data[p] for p in percentages]
+
+        # Prepend (0, 0) for a proper CDF start
+        percentages.insert(0, 0)
+        cumulative_pcts.insert(0, 0)
+
+        plt.plot(
+            percentages,
+            cumulative_pcts,
+            marker=marker,
+            linestyle='-',
+            color=color,
+            linewidth=2,
+            label=label
+        )
+
+        if bands is not None:
+            lower, upper = bands[i]
+            band_ends = sorted(lower.keys())
+            plt.fill_between(
+                [0] + band_ends,
+                [0] + [lower[p] for p in band_ends],
+                [0] + [upper[p] for p in band_ends],
+                color=color,
+                alpha=0.2,
+                linewidth=0
+            )
+
+    # Add labels and title
+    plt.title('F2FS Segment Valid Blocks CDF', fontsize=16)
+    plt.xlabel('Valid Block %', fontsize=12)
+    plt.ylabel('Cumulative % of Segments', fontsize=12)
+
+    # Final plot settings
+    plt.xlim(0, 100)
+    plt.ylim(0, 100)
+
+    plt.axhline(y=100, color='gray', linestyle='--', linewidth=1)
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.legend(loc='lower right', title="Policies")
+    plt.tight_layout()
+    plt.savefig(output_file)
+    plt.close()
+
+
+def load_cdf(file_name):
+    """
+    Parses one SIT dump and returns its cumulative distribution, or None.
+    """
+    print(f"\n📂 Processing file: **{file_name}**")
+
+    vblock_percentages, total_lines = parse_f2fs_summary(file_name)
+
+    if vblock_percentages is None:
+        return None
+
+    total_segments = len(vblock_percentages)
+    print(f"Total lines read: {total_lines}")
+    print(f"✅ Found {total_segments} qualifying segments (type in 0, 1, 2).")
+
+    if not vblock_percentages:
+        print(f"🛑 No segments found in {file_name}. Skipping plot for this file.")
+        return None
+
+    sorted_bins = create_histogram(vblock_percentages, PARTITION_SIZE_PERCENT)
+    cumulative_percentages = create_cumulative_distribution(sorted_bins, total_segments)
+
+    # Display a few key points for inspection (e.g., 0%, 50%, 100%)
+    print("📈 Sample Cumulative Distribution Points:")
+    print("{:<12} | {:<5}".format("VBlock % <=", "Cumulative %"))
+    print("-" * 28)
+    display_points = [p for p in cumulative_percentages if p % 50 == 0 or p == 10]
+    for percent in sorted(display_points):
+        print("{:<12} | {:<5.2f}%".format(f"{percent}%", cumulative_percentages[percent]))
+
+    return cumulative_percentages
+
+
+def run_bootstrap(args, labels):
+    """
+    Pools the runs of every configuration into one CDF and adds its bootstrap band.
+    """
+    rng = np.random.default_rng(args.seed)
+    all_cdf_data = []
+    bands = []
+
+    for label, file_names in group_by_label(zip(args.inputs, labels)):
+        run_counts = []
+        for file_name in file_names:
+            vblock_percentages, _ = parse_f2fs_summary(file_name)
+            if vblock_percentages:
+                run_counts.append(histogram_counts(vblock_percentages))
+
+        if not run_counts:
+            print(f"🛑 No segments found for {label}. Skipping plot for this configuration.")
+            continue
+
+        run_counts = np.array(run_counts)
+        pooled = run_counts.sum(axis=0)
+        # Pooled CDF at every bin end, the same points the band is computed at
+        cumulative_percentages = dict(zip(BIN_EDGES[1:], pooled.cumsum() / pooled.sum() * 100))
+        lower, upper = bootstrap_cdf_band(run_counts, args.bootstrap, args.confidence, rng)
+
+        all_cdf_data.append((label, cumulative_percentages))
+        bands.append((lower, upper))
+
+        print(f"\n📂 {label}: {len(run_counts)} runs, {int(pooled.sum())} segments")
+        print("{:<12} | {:<14} | {}".format("VBlock % <=", "Cumulative %", f"{args.confidence:.0%} CI"))
+        print("-" * 44)
+        for percent in (10, 50, 100):
+            print("{:<12} | {:<14} | {:.2f}% - {:.2f}%".format(
+                f"{percent}%", f"{cumulative_percentages[percent]:.2f}%", lower[percent], upper[percent]))
+
+    if not all_cdf_data:
+        print("\n🛑 No valid data found across all files. Cannot generate plot.")
+        return
+
+    output_file = comparison_path(args.inputs[0], [label for label, _ in all_cdf_data],
+                                  OUTPUT_CDF_SUFFIX, args.output, args.output_dir)
+    plot_cumulative_comparison(all_cdf_data, output_file, bands)
+    print(f"\n\n🖼️ Comparison CDF Plot with bootstrap bands saved to: **{output_file}**")
+
+
+def run(args):
+    """
+    Entry point for 'sit-cdf'.
+    """
+    labels = args.labels or [policy_label(p) for p in args.inputs]
+
+    if args.bootstrap:
+        if args.each:
+            print("--each is ignored with --bootstrap; writing one comparison plot.")
+        run_bootstrap(args, labels)
+        return
+
+    print(f"🔬 Starting F2FS Segment Summary Analysis for {len(args.inputs)} files...")
+
+    all_cdf_data = []
+    for file_name, label in zip(args.inputs, labels):
+        cumulative_percentages = load_cdf(file_name)
+        if cumulative_percentages is None:
+            continue
+
+        if args.each:
+            output_file = output_path(file_name, label_slug(label), "vblock_cdf.png", args.output_dir)
+            plot_cumulative_comparison([(label, cumulative_percentages)], output_file)
+            print(f"🖼️ CDF Plot saved to: **{output_file}**")
+        else:
+            all_cdf_data.append((label, cumulative_percentages))
+
+    if args.each:
+        return
+
+    if all_cdf_data:
+        output_file = comparison_path(args.inputs[0], [label for label, _ in all_cdf_data],
+                                      OUTPUT_CDF_SUFFIX, args.output, args.output_dir)
+        plot_cumulative_comparison(all_cdf_data, output_file)
+        print(f"\n\n🖼️ Comparison CDF Plot generated and saved to: **{output_file}**")
+    else:
+        print("\n🛑 No valid data found across all files. Cannot generate plot.")
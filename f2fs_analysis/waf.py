@@ -0,0 +1,105 @@
+"""
+waf: write amplification per configuration, read from the results.txt
+files ('Write Amplification: X') or vm_scripts/waf.sh output ('WAF: X').
+"""
+import re
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .bootstrap import bootstrap_mean, percentile_interval
+from .common import comparison_path, group_by_label, labelled_inputs, open_text
+
+OUTPUT_WAF_SUFFIX = "waf_comparison.png"
+
+# The bootstrap of a mean over fewer runs only reports about [min, max]
+MIN_CI_RUNS = 3
+
+WAF_PATTERN = re.compile(r'^(?:Write Amplification|WAF):\s*(?P<waf>[0-9.]+)', re.MULTILINE)
+
+
+def read_waf(file_path):
+    """
+    Returns the first WAF reported in the file, or None.
+    """
+    with open_text(file_path) as f:
+        match = WAF_PATTERN.search(f.read())
+    if match is None:
+        return None
+    return float(match.group('waf'))
+
+
+def plot_waf(summary, output_file, confidence=None):
+    """
+    Bar chart of the mean WAF per configuration, with bootstrap error bars
+    when the summary carries an interval.
+
+    :param summary: List of (label, mean, lower, upper); lower/upper may be None
+    """
+    labels = [label for label, _, _, _ in summary]
+    means = np.array([mean for _, mean, _, _ in summary])
+
+    plt.figure(figsize=(max(6, 1.5 * len(summary)), 5))
+    yerr = None
+    if confidence is not None:
+        # Configurations without an interval (a single run) get no error bar
+        lower = np.array([mean if low is None else low for _, mean, low, _ in summary])
+        upper = np.array([mean if high is None else high for _, mean, _, high in summary])
+        yerr = np.vstack([means - lower, upper - means])
+    plt.bar(labels, means, yerr=yerr, capsize=6, color='#3498db', edgecolor='black', alpha=0.8)
+
+    plt.ylabel('Write Amplification Factor')
+    title = 'Write Amplification per Configuration'
+    if confidence is not None:
+        title += f' ({confidence:.0%} bootstrap CI)'
+    plt.title(title)
+    plt.grid(True, axis='y', linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    plt.savefig(output_file)
+    plt.close()
+
+
+def run(args):
+    """
+    Entry point for 'waf'.
+    """
+    rng = np.random.default_rng(args.seed)
+    summary = []
+
+    for label, file_paths in group_by_label(labelled_inputs(args.inputs, args.labels)):
+        values = []
+        for file_path in file_paths:
+            try:
+                waf = read_waf(file_path)
+            except FileNotFoundError:
+                print(f"Error: Could not find file {file_path}")
+                continue
+            if waf is None:
+                print(f"No WAF line found in {file_path}, skipping.")
+                continue
+            values.append(waf)
+
+        if not values:
+            continue
+
+        mean = float(np.mean(values))
+        if args.bootstrap and len(values) < MIN_CI_RUNS:
+            lower = upper = None
+            print(f"{label}: WAF {mean:.3f} ({len(values)} runs, no confidence interval; "
+                  f"need at least {MIN_CI_RUNS} runs)")
+        elif args.bootstrap:
+            lower, upper = percentile_interval(bootstrap_mean(values, args.bootstrap, rng), args.confidence)
+            print(f"{label}: WAF {mean:.3f} ({args.confidence:.0%} CI {lower:.3f} - {upper:.3f}, {len(values)} runs)")
+        else:
+            lower = upper = None
+            print(f"{label}: WAF {mean:.3f} ({len(values)} runs)")
+        summary.append((label, mean, lower, upper))
+
+    if not summary:
+        print("No WAF values found. Cannot generate plot.")
+        return
+
+    output_file = comparison_path(args.inputs[0], [label for label, _, _, _ in summary],
+                                  OUTPUT_WAF_SUFFIX, args.output, args.output_dir)
+    plot_waf(summary, output_file, args.confidence if args.bootstrap else None)
+    print(f"Saved: {output_file}")
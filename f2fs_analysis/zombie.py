@@ -0,0 +1,295 @@
+"""
+zombie / zombie-curve: zombie-block analysis of FEMU per-block stats
+(femu_stats.csv with columns sample, ch, lun, pl, blk, vpc, ipc, ...).
+"""
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from .bootstrap import bootstrap_histograms, bootstrap_proportion, percentile_interval
+from .common import group_by_label, labelled_inputs, output_path
+
+BLOCK_KEY = ['ch', 'lun', 'pl', 'blk']
+
+# Zombie Definition: 30% - 70% Invalid
+ZOMBIE_LOW = 0.3
+ZOMBIE_HIGH = 0.7
+
+HIST_EDGES = np.linspace(0, 1, 51)
+
+REQUIRED_COLUMNS = ['sample'] + BLOCK_KEY + ['vpc', 'ipc']
+
+
+def read_block_stats(file_path):
+    """
+    Loads a FEMU block stats CSV, or returns None (after saying why) when the
+    file is missing or lacks the block columns, so one bad input does not
+    abort a batch.
+    """
+    try:
+        df = pd.read_csv(file_path)
+    except FileNotFoundError:
+        print(f"Error: Could not find file {file_path}")
+        return None
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        print(f"Skipping {file_path}: missing columns {', '.join(missing)}")
+        return None
+    return df
+
+
+def active_blocks(latest):
+    """
+    Keeps blocks that are not completely empty and adds their invalid ratio.
+    """
+    active = latest[(latest['vpc'] > 0) | (latest['ipc'] > 0)].copy()
+    active['invalid_ratio'] = active['ipc'] / (active['vpc'] + active['ipc'])
+    active['invalid_ratio'] = active['invalid_ratio'].fillna(0)
+    return active
+
+
+def classify(invalid_ratio):
+    """
+    Boolean masks (cold, zombie, hot) for a Series of invalid ratios.
+    """
+    cold = invalid_ratio < ZOMBIE_LOW
+    zombie = (invalid_ratio >= ZOMBIE_LOW) & (invalid_ratio <= ZOMBIE_HIGH)
+    hot = invalid_ratio > ZOMBIE_HIGH
+    return cold, zombie, hot
+
+
+def block_state_evolution(df):
+    """
+    Percentage of cold / zombie / hot blocks and the active block count for
+    every sample, computed with one groupby over the whole trace instead of
+    filtering the frame once per sample.
+    """
+    samples = pd.Index(sorted(df['sample'].unique()), name='sample')
+
+    # Duplicates of a block within a sample: the last row wins
+    latest = df.groupby(['sample'] + BLOCK_KEY, sort=False).last().reset_index()
+    active = active_blocks(latest)
+    cold, zombie, hot = classify(active['invalid_ratio'])
+
+    counts = pd.DataFrame({
+        'sample': active['sample'],
+        'cold': cold,
+        'zombie': zombie,
+        'hot': hot,
+    }).groupby('sample').sum()
+    active_count = active.groupby('sample').size()
+
+    evolution = counts.div(active_count, axis=0).mul(100)
+    evolution['active'] = active_count
+    # Samples without any active block report 0 everywhere
+    return evolution.reindex(samples, fill_value=0)
+
+
+def plot_temporal(evolution, label, output_file):
+    """
+    Hot / zombie / cold percentages over time plus the active block count.
+    Samples without any active block are left out, as cloudlab/zombie.py did.
+    """
+    evolution = evolution[evolution['active'] > 0]
+    x = range(len(evolution))
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+
+    # Temporal evolution
+    ax1.plot(x, evolution['cold'], 'b-', linewidth=2, label='Cold (<30% invalid)')
+    ax1.plot(x, evolution['zombie'], 'orange', linewidth=3, label='Zombie (30-70% invalid)')
+    ax1.plot(x, evolution['hot'], 'r-', linewidth=2, label='Hot (>70% invalid)')
+    ax1.fill_between(x, evolution['zombie'], alpha=0.3, color='orange')
+    ax1.set_xlabel('Time (sample points)', fontsize=12)
+    ax1.set_ylabel('Block Percentage (%)', fontsize=12)
+    ax1.set_title(f'{label}: Temporal Evolution of Block States', fontsize=14)
+    ax1.legend(fontsize=11, loc='best')
+    ax1.grid(True, alpha=0.3)
+    ax1.set_ylim([0, 100])
+
+    # Active blocks growth
+    ax2.plot(x, evolution['active'], 'g-', linewidth=2)
+    ax2.set_xlabel('Time (sample points)', fontsize=12)
+    ax2.set_ylabel('Active Blocks', fontsize=12)
+    ax2.set_title('Block Usage Over Time', fontsize=14)
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300)
+    plt.close(fig)
+
+
+def plot_zombie_only(evolution, label, output_file):
+    """
+    Zombie curve alone, annotated with the GC saturation peak and the drop
+    that follows a successful compaction.
+    """
+    zombie_pct = list(evolution['zombie'])
+    x = range(len(zombie_pct))
+
+    plt.figure(figsize=(12, 7))
+
+    # Plot the Curve
+    plt.plot(x, zombie_pct, color='orange', linewidth=3, label='Zombie Segments (30-70% Invalid)')
+    plt.fill_between(x, zombie_pct, color='orange', alpha=0.2)
+
+    # --- ANNOTATIONS ---
+    # 1. Peak (GC Saturation)
+    if len(zombie_pct) > 0:
+        peak_val = max(zombie_pct)
+        peak_idx = zombie_pct.index(peak_val)
+
+        plt.annotate(f'GC Saturation\n(Peak: {peak_val:.1f}%)',
+                     xy=(peak_idx, peak_val), xytext=(peak_idx, peak_val + 10),
+                     arrowprops=dict(facecolor='red', shrink=0.05),
+                     bbox=dict(boxstyle='round', facecolor='white', alpha=0.8), color='red')
+
+        # 2. The Drop (Compaction Success)
+        # Find point after peak where it drops low
+        for i in range(peak_idx, len(zombie_pct)):
+            if zombie_pct[i] < (peak_val / 4):  # Drops to 25% of peak
+                plt.annotate('Compaction Success\n(Zombies Removed)',
+                             xy=(i, zombie_pct[i]), xytext=(i - 10, zombie_pct[i] + 15),
+                             arrowprops=dict(facecolor='blue', shrink=0.05),
+                             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8), color='blue')
+                break
+
+    plt.xlabel('Time (Sample Points)', fontsize=12)
+    plt.ylabel('Percentage of Disk (%)', fontsize=12)
+    plt.title(f'{label}: Evolution of Zombie Segments', fontsize=14)
+    plt.ylim(0, 100)
+    plt.grid(True, linestyle='--', alpha=0.5)
+    plt.legend(loc='upper right')
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300)
+    plt.close()
+
+
+def plot_snapshot(active, label, output_file, weights=None, band=None, title=None):
+    """
+    Histogram of invalid page ratios with the zombie band marked.
+
+    :param weights: Optional per-block weights, e.g. 1/runs for a per-run mean
+    :param band: Optional (lower, upper) bin counts drawn as a confidence band
+    """
+    if title is None:
+        zombie_count = int(classify(active['invalid_ratio'])[1].sum())
+        zombie_share = zombie_count / len(active) * 100 if len(active) else 0.0
+        title = f'{label}: {zombie_count} Zombie Blocks ({zombie_share:.1f}%)'
+
+    plt.figure(figsize=(8, 5))
+    plt.hist(active['invalid_ratio'], bins=HIST_EDGES, weights=weights, edgecolor='black', alpha=0.7)
+    if band is not None:
+        lower, upper = band
+        plt.fill_between(HIST_EDGES, np.append(lower, lower[-1]), np.append(upper, upper[-1]),
+                         step='post', color='gray', alpha=0.5, label='Bootstrap CI')
+        plt.legend()
+    plt.axvline(ZOMBIE_LOW, color='blue', linestyle='--')
+    plt.axvline(ZOMBIE_HIGH, color='red', linestyle='--')
+    plt.xlabel('Invalid Page Ratio')
+    plt.ylabel('Block Count' if weights is None else 'Block Count (mean per run)')
+    plt.title(title)
+    plt.savefig(output_file, dpi=300)
+    plt.close()
+
+
+def run_snapshot_bootstrap(args):
+    """
+    'zombie --bootstrap': zombie share and invalid-ratio histogram of every
+    configuration with bootstrap confidence intervals over its runs.
+    """
+    rng = np.random.default_rng(args.seed)
+
+    for label, file_paths in group_by_label(labelled_inputs(args.inputs, args.labels)):
+        runs = []
+        for file_path in file_paths:
+            print(f"Reading {file_path}...")
+            df = read_block_stats(file_path)
+            if df is None:
+                continue
+            runs.append(active_blocks(df.groupby(BLOCK_KEY).last().reset_index()))
+
+        totals = [len(active) for active in runs]
+        if not runs or sum(totals) == 0:
+            print(f"{label}: no active blocks in any run, skipping.")
+            continue
+        zombies = [int(classify(active['invalid_ratio'])[1].sum()) for active in runs]
+        n_runs = sum(1 for total in totals if total > 0)
+
+        shares = bootstrap_proportion(zombies, totals, args.bootstrap, rng) * 100
+        share_low, share_high = percentile_interval(shares, args.confidence)
+        zombie_share = sum(zombies) / sum(totals) * 100
+
+        counts = np.array([np.histogram(active['invalid_ratio'], bins=HIST_EDGES)[0] for active in runs])
+        resampled = bootstrap_histograms(counts, args.bootstrap, rng) / n_runs
+        band = percentile_interval(resampled, args.confidence)
+
+        print(f"{label}: {n_runs} runs, {sum(totals)} active blocks")
+        print(f"Zombie %: {zombie_share:.1f}% ({args.confidence:.0%} CI {share_low:.1f}% - {share_high:.1f}%)")
+
+        pooled = pd.concat(runs, ignore_index=True)
+        title = (f'{label}: Zombie {zombie_share:.1f}% '
+                 f'({args.confidence:.0%} CI {share_low:.1f}-{share_high:.1f}%, {n_runs} runs)')
+        output_file = output_path(file_paths[0], label, 'zombie.png', args.output_dir)
+        plot_snapshot(pooled, label, output_file,
+                      weights=np.full(len(pooled), 1 / n_runs), band=band, title=title)
+        print(f"Saved: {output_file}")
+
+
+def run_snapshot(args):
+    """
+    Entry point for 'zombie': zombie share of the last state of every block.
+    """
+    if args.bootstrap:
+        run_snapshot_bootstrap(args)
+        return
+
+    for file_path, label in labelled_inputs(args.inputs, args.labels):
+        print(f"Reading {file_path}...")
+        df = read_block_stats(file_path)
+        if df is None:
+            continue
+
+        latest = df.groupby(BLOCK_KEY).last().reset_index()
+        active = active_blocks(latest)
+        zombie = active[classify(active['invalid_ratio'])[1]]
+
+        print(f"Active blocks: {len(active)}")
+        print(f"Zombie blocks: {len(zombie)}")
+        if len(active):
+            print(f"Zombie %: {len(zombie)/len(active)*100:.1f}%")
+
+        output_file = output_path(file_path, label, 'zombie.png', args.output_dir)
+        plot_snapshot(active, label, output_file)
+        print(f"Saved: {output_file}")
+
+        # Save data
+        data_file = output_path(file_path, label, 'zombie_data.csv', args.output_dir)
+        active[['invalid_ratio']].to_csv(data_file, index=False)
+
+
+def run_curve(args):
+    """
+    Entry point for 'zombie-curve': block states across all samples.
+    """
+    for file_path, label in labelled_inputs(args.inputs, args.labels):
+        print(f"Reading {file_path}...")
+        df = read_block_stats(file_path)
+        if df is None:
+            continue
+
+        evolution = block_state_evolution(df)
+        print(f"Processed {len(evolution)} samples...")
+
+        if args.zombie_only:
+            output_file = output_path(file_path, label, 'zombie_curve.png', args.output_dir)
+            plot_zombie_only(evolution, label, output_file)
+        else:
+            output_file = output_path(file_path, label, 'temporal.png', args.output_dir)
+            plot_temporal(evolution, label, output_file)
+        print(f"Saved: {output_file}")
+
+        if len(evolution):
+            peak_sample = evolution['zombie'].idxmax()
+            print(f"Peak zombies: {evolution['zombie'].max():.1f}% at sample {peak_sample}")
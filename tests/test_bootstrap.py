@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from f2fs_analysis.bootstrap import (
+    bootstrap_histograms,
+    bootstrap_mean,
+    bootstrap_proportion,
+    percentile_interval,
+    resample_runs,
+)
+
+COUNTS = np.array([
+    [5, 3, 2, 0],
+    [0, 0, 0, 0],
+    [1, 4, 4, 1],
+    [7, 0, 1, 2],
+])
+
+
+def test_histogram_shape():
+    drawn = bootstrap_histograms(COUNTS, 50, np.random.default_rng(0))
+    assert drawn.shape == (50, COUNTS.shape[1])
+
+
+def test_histogram_totals_match_picked_runs():
+    # Same seed: the first draw of bootstrap_histograms is the run picks
+    kept = COUNTS[COUNTS.sum(axis=1) > 0]
+    picks = resample_runs(len(kept), 20, np.random.default_rng(1))
+    drawn = bootstrap_histograms(COUNTS, 20, np.random.default_rng(1))
+    np.testing.assert_array_equal(drawn.sum(axis=1), kept.sum(axis=1)[picks].sum(axis=1))
+
+
+def test_histogram_drops_empty_runs():
+    drawn = bootstrap_histograms([[0, 0], [3, 1]], 10, np.random.default_rng(2))
+    # Only the non-empty run can be picked, so every resample has its total
+    assert (drawn.sum(axis=1) == 4).all()
+
+
+def test_histogram_without_counts():
+    with pytest.raises(ValueError):
+        bootstrap_histograms([[0, 0], [0, 0]], 10, np.random.default_rng(0))
+
+
+def test_proportion():
+    rng = np.random.default_rng(3)
+    drawn = bootstrap_proportion([10, 0, 30], [100, 0, 100], 200, rng)
+    assert drawn.shape == (200,)
+    assert ((drawn >= 0) & (drawn <= 1)).all()
+
+    lower, upper = percentile_interval(drawn)
+    assert lower <= 40 / 200 <= upper
+
+
+def test_proportion_without_samples():
+    with pytest.raises(ValueError):
+        bootstrap_proportion([0, 0], [0, 0], 10, np.random.default_rng(0))
+
+
+def test_mean():
+    values = [4.7, 5.1, 5.6, 6.0]
+    drawn = bootstrap_mean(values, 500, np.random.default_rng(4))
+    assert drawn.shape == (500,)
+
+    lower, upper = percentile_interval(drawn, 0.9)
+    assert min(values) <= lower <= np.mean(values) <= upper <= max(values)
+
+
+def test_mean_without_values():
+    with pytest.raises(ValueError):
+        bootstrap_mean([], 10, np.random.default_rng(0))
+
+
+def test_interval_per_bin():
+    drawn = bootstrap_histograms(COUNTS, 300, np.random.default_rng(5))
+    lower, upper = percentile_interval(drawn)
+    assert lower.shape == upper.shape == (COUNTS.shape[1],)
+    assert (lower <= upper).all()
+    assert ((lower <= COUNTS.sum(axis=0)) & (COUNTS.sum(axis=0) <= upper)).all()
@@ -0,0 +1,117 @@
+import asyncio
+import csv
+from pathlib import Path
+
+import pytest
+
+from f2fs_analysis.collector import COLUMNS, Collector, parse_status
+from f2fs_analysis.f2fs_metrics import read_collector_log
+
+STATUS_FILE = Path(__file__).resolve().parent.parent / 'f2fs' / 'status_1.txt'
+
+# /sys/block/<dev>/stat: read I/Os, merges, sectors, ticks, write I/Os, merges, sectors, ...
+STAT_LINE = "   20912       56  1286000     9876    14526      120  1234567     5432        0     7000    15000\n"
+
+TRACE_LINES = (
+    "  kworker-1 [000] 12.3: f2fs_gc_begin: dev = (259,0)\n"
+    "  kworker-1 [000] 12.4: f2fs_gc_end: dev = (259,0)\n"
+    "  kworker-1 [000] 12.5: f2fs_gc_begin: dev = (259,0)\n"
+)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    stat = tmp_path / 'stat'
+    stat.write_text(STAT_LINE)
+    trace = tmp_path / 'trace'
+    trace.write_text(TRACE_LINES)
+    return stat, trace
+
+
+def collect(output, stat, trace, **kwargs):
+    collector = Collector(str(output), status_path=str(STATUS_FILE), stat_path=str(stat),
+                          trace_path=str(trace), status_interval=0.05, disk_interval=0.05,
+                          trace_interval=0.05, flush_interval=0.05, **kwargs)
+    asyncio.run(collector.run(duration=0.3))
+    return collector
+
+
+def read_rows(output):
+    with open(output) as f:
+        return list(csv.DictReader(f))
+
+
+def test_parse_status():
+    row = parse_status(STATUS_FILE.read_text())
+    assert row['dirty_segs'] == 69
+    assert row['free_segs'] == 8060
+    assert row['valid_segs'] == 6
+
+
+def test_collect_fixture_files(tmp_path, sources):
+    stat, trace = sources
+    output = tmp_path / 'collector.csv'
+    collector = collect(output, stat, trace)
+
+    assert output.read_text().splitlines()[0] == ','.join(COLUMNS)
+    rows = read_rows(output)
+    assert len(rows) == collector.rows_written
+    by_source = {source: [row for row in rows if row['source'] == source]
+                 for source in ('status', 'disk', 'trace')}
+    assert all(by_source.values())
+
+    status = by_source['status'][0]
+    assert (status['dirty_segs'], status['free_segs'], status['disk_percent']) == ('69', '8060', '')
+    disk = by_source['disk'][0]
+    assert (disk['read_ios'], disk['sectors_read'], disk['write_ios'], disk['sectors_written']) == (
+        '20912', '1286000', '14526', '1234567')
+    # The reader thread may not have reached the end of the file on the first tick
+    trace_row = by_source['trace'][-1]
+    assert (trace_row['gc_begin'], trace_row['gc_end']) == ('2', '1')
+
+
+def test_collect_appends_without_second_header(tmp_path, sources):
+    stat, trace = sources
+    output = tmp_path / 'collector.csv'
+    collect(output, stat, trace)
+    collect(output, stat, trace)
+    assert output.read_text().count('timestamp,') == 1
+
+
+def test_bad_stat_file_fails_at_startup(tmp_path, sources):
+    _, trace = sources
+    diskstats = tmp_path / 'diskstats'
+    diskstats.write_text("  259       0 nvme0n1 20912 56 14526 1286 1234567 9876 0 0 0\n")
+    with pytest.raises(ValueError):
+        collect(tmp_path / 'collector.csv', diskstats, trace)
+
+
+def test_read_collector_log(tmp_path, sources):
+    stat, trace = sources
+    output = tmp_path / 'collector.csv'
+    collect(output, stat, trace, mount_point=str(tmp_path))
+
+    with open(output) as f:
+        metrics = read_collector_log(csv.DictReader(f))
+
+    n_status = sum(row['source'] == 'status' for row in read_rows(output))
+    assert metrics['rounds'] == list(range(1, n_status + 1))
+    assert set(metrics['dirty_segs']) == {69}
+    assert set(metrics['free_segs']) == {8060}
+    # The stat file does not change, so nothing was written during the run
+    assert set(metrics['physical_mb']) == {0}
+    assert all(0 <= pct <= 100 for pct in metrics['disk_pct'])
+    assert max(metrics['gc_events']) <= 2
+
+
+def test_read_collector_log_without_mount(tmp_path, sources):
+    stat, trace = sources
+    output = tmp_path / 'collector.csv'
+    collect(output, stat, trace)
+
+    with open(output) as f:
+        metrics = read_collector_log(csv.DictReader(f))
+
+    # Falls back to the F2FS utilization of the status file (0%)
+    assert metrics['rounds']
+    assert set(metrics['disk_pct']) == {0}